@@ -11,26 +11,81 @@ EEZO 2026 タスクダッシュボード
     http://127.0.0.1:8050
 """
 
+import numpy as np
 import pandas as pd
-from dash import Dash, html, dcc, callback, Output, Input, State, no_update, ctx
+from dash import Dash, html, dcc, callback, Output, Input, State, no_update, ctx, ClientsideFunction, Patch
 import dash_bootstrap_components as dbc
-import plotly.express as px
+from flask_caching import Cache
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime, date, timedelta
 from io import BytesIO
+import orjson
 import os
-from typing import Optional
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from typing import Optional, Sequence, Union
+import xlsxwriter
+
+# Plotly の JSON 変換は orjson で行う（Dash のコールバック応答も同じエンジンで変換される）
+pio.json.config.default_engine = "orjson"
 
 # =============================================================================
 # 定数定義
 # =============================================================================
 
 DATA_PATH = "data/raw/eezo_2026_weekly_tasks.csv"
+DATA_CACHE_DIR = "data/cache"
 OUTPUT_DIR = "output"
 
+# Excel出力のWorkbookオプション（行を逐次書き出してメモリを抑える）
+EXCEL_WORKBOOK_OPTIONS: dict[str, bool] = {
+    "constant_memory": True,
+    "strings_to_urls": False,
+}
+
+# ガントチャートの共通レイアウト
+GANTT_LAYOUT: dict = dict(
+    xaxis_title="日付",
+    yaxis_title="",
+    showlegend=True,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1,
+        bgcolor="rgba(255,255,255,0.8)",
+        tracegroupgap=0
+    ),
+    margin=dict(l=300, r=50, t=80, b=50),
+    paper_bgcolor="white",
+    plot_bgcolor="#fafafa",
+    font=dict(family="Noto Sans JP, sans-serif"),
+)
+
+# 時間粒度ごとのX軸設定（目盛り間隔・表示形式・グリッド線）
+GANTT_XAXIS_GRID: dict = dict(showgrid=True, gridwidth=1, gridcolor="rgba(0,0,0,0.1)")
+GANTT_XAXES: dict[str, dict] = {
+    "day": dict(dtick="D1", tickformat="%m/%d", tickangle=45, **GANTT_XAXIS_GRID),
+    "week": dict(dtick="D7", tickformat="%m/%d", **GANTT_XAXIS_GRID),
+    "month": dict(dtick="M1", tickformat="%Y/%m", **GANTT_XAXIS_GRID),
+}
+
+# Y軸のグリッド線
+GANTT_YAXIS: dict = dict(showgrid=True, gridwidth=1, gridcolor="rgba(0,0,0,0.05)")
+
+# 時間粒度ごとのレイアウト雛形（描画ごとの検証・構築を避けるため起動時に1回だけ作る）
+GANTT_BASE_LAYOUTS: dict[str, go.Layout] = {
+    key: go.Layout(GANTT_LAYOUT).update(
+        barmode="overlay",
+        xaxis=dict(type="date", **xaxis),
+        yaxis=dict(categoryorder="array", **GANTT_YAXIS),
+    )
+    for key, xaxis in GANTT_XAXES.items()
+}
+
+# パース済みデータキャッシュの版数（読み込み処理を変えたら上げる）
+DATA_CACHE_VERSION = 3
+
 # カテゴリ色設定（CLAUDE.md準拠）
 CATEGORY_COLORS: dict[str, str] = {
     "プラットフォーム実装": "#3498db",  # 青
@@ -58,12 +113,60 @@ ASSIGNEE_COLORS: dict[str, str] = {
 # 担当者のデフォルト順序
 DEFAULT_ASSIGNEE_ORDER: list[str] = ["松永", "高山"]
 
+# ドロップダウンで絞り込むカテゴリ列
+FILTER_COLUMNS: list[str] = ["四半期", "担当者", "カテゴリ"]
+
+# グループ化ごとのY軸ラベル列（読み込み時に事前計算）
+Y_LABEL_COLUMNS: dict[str, str] = {
+    "none": "タスク",
+    "担当者": "y_label_担当者",
+    "カテゴリ": "y_label_カテゴリ",
+}
+
+# ガントチャートのキャッシュ有効期限（秒）
+CACHE_TIMEOUT = 600
+
 
 # =============================================================================
 # データ読み込み
 # =============================================================================
 
-def load_data(filepath: str) -> pd.DataFrame:
+def load_data(filepath: str, cache_dir: Optional[str] = DATA_CACHE_DIR) -> pd.DataFrame:
+    """
+    タスクデータを読み込む。
+
+    パース済みのデータを Feather 形式で cache_dir に保存し、
+    CSVより新しいキャッシュがあればCSVのパースを省略する。
+
+    Args:
+        filepath: CSVファイルのパス
+        cache_dir: キャッシュの保存先（Noneでキャッシュしない）
+
+    Returns:
+        pd.DataFrame: 読み込んだデータフレーム
+    """
+    if cache_dir is None:
+        return parse_task_csv(filepath)
+
+    cache_name = f"{os.path.basename(filepath)}.v{DATA_CACHE_VERSION}.feather"
+    cache_path = os.path.join(cache_dir, cache_name)
+    if (
+        os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) >= os.path.getmtime(filepath)
+    ):
+        return pd.read_feather(cache_path)
+
+    df = parse_task_csv(filepath)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_feather(cache_path)
+    except OSError:
+        # キャッシュを書けなくても読み込み自体は続行する
+        pass
+    return df
+
+
+def parse_task_csv(filepath: str) -> pd.DataFrame:
     """
     CSVファイルを読み込み、日付をパースする。
 
@@ -73,9 +176,21 @@ def load_data(filepath: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: 読み込んだデータフレーム
     """
-    df = pd.read_csv(filepath, encoding="utf-8")
-    df["開始日"] = pd.to_datetime(df["開始日"], format="%Y/%m/%d")
-    df["終了日"] = pd.to_datetime(df["終了日"], format="%Y/%m/%d")
+    # 日付とフィルター列の型はCSVの読み込み時にまとめて決める
+    df = pd.read_csv(
+        filepath,
+        encoding="utf-8",
+        dtype={col: "category" for col in FILTER_COLUMNS},
+        parse_dates=["開始日", "終了日"],
+        date_format="%Y/%m/%d",
+        cache_dates=True
+    )
+
+    # フィルター列は絞り込み・集計を整数コードで行う。カテゴリはCSV出現順に並べ替える
+    for col in FILTER_COLUMNS:
+        codes = df[col].cat.codes.to_numpy()
+        first_seen = pd.unique(codes[codes >= 0])
+        df[col] = df[col].cat.reorder_categories(df[col].cat.categories[first_seen])
 
     # マイルストーンフラグを追加（★マーク付き）
     df["is_milestone"] = df["成果物/マイルストーン"].str.contains("★", na=False)
@@ -83,12 +198,109 @@ def load_data(filepath: str) -> pd.DataFrame:
     # タスクIDを追加
     df["task_id"] = range(1, len(df) + 1)
 
-    # 期間（日数）を計算
-    df["期間"] = (df["終了日"] - df["開始日"]).dt.days + 1
+    # 期間（日数）を計算（Timedelta を経由せず日単位の整数差で求める）
+    start_days = df["開始日"].to_numpy().astype("datetime64[D]")
+    end_days = df["終了日"].to_numpy().astype("datetime64[D]")
+    df["期間"] = (end_days - start_days).astype(np.int32) + 1
+
+    # グループ化用のY軸ラベル（「担当者 | タスク」等）
+    for group_col in ["担当者", "カテゴリ"]:
+        df[Y_LABEL_COLUMNS[group_col]] = df[group_col].astype(str) + " | " + df["タスク"]
 
     return df
 
 
+def build_filter_codes(df: pd.DataFrame) -> dict[str, tuple[pd.Index, np.ndarray]]:
+    """
+    フィルター列ごとにカテゴリ一覧と行ごとの整数コードを取り出す。
+
+    コールバックごとに isin で文字列をハッシュし直す代わりに、
+    整数コードと選択値のルックアップ表だけで絞り込めるようにする。
+
+    Args:
+        df: タスクデータフレーム
+
+    Returns:
+        dict[str, tuple[pd.Index, np.ndarray]]: 列名 → (カテゴリ一覧, コード配列)
+    """
+    return {
+        col: (df[col].cat.categories, df[col].cat.codes.to_numpy())
+        for col in FILTER_COLUMNS
+    }
+
+
+def combine_filter_masks(
+    filter_codes: dict[str, tuple[pd.Index, np.ndarray]],
+    selections: dict[str, list[str]],
+    n_rows: int
+) -> np.ndarray:
+    """
+    選択値から列ごとの許可表を作り、コード配列を引いて列間で AND する。
+
+    選択数に関係なく、各列につき行数分の参照1回で済む。
+
+    Args:
+        filter_codes: build_filter_codes の戻り値
+        selections: 列名 → 選択された値のリスト
+        n_rows: データフレームの行数
+
+    Returns:
+        np.ndarray: 条件を満たす行のブール配列
+    """
+    result = np.ones(n_rows, dtype=bool)
+    for col, selected in selections.items():
+        categories, codes = filter_codes[col]
+        # 末尾の要素は欠損値（コード -1）用で常に False
+        allowed = np.zeros(len(categories) + 1, dtype=bool)
+        positions = categories.get_indexer(list(selected or []))
+        allowed[positions[positions >= 0]] = True
+        np.logical_and(result, allowed[codes], out=result)
+    return result
+
+
+def count_by_category(series: pd.Series) -> list[tuple[str, int]]:
+    """
+    カテゴリ型の列を値ごとに件数集計する。
+
+    groupby を使わず、整数コードを np.bincount で数える。
+
+    Args:
+        series: カテゴリ型の列
+
+    Returns:
+        list[tuple[str, int]]: (値, 件数) のリスト（カテゴリ順、0件は除外）
+    """
+    categories = series.cat.categories
+    codes = series.cat.codes.to_numpy()
+    # 欠損（コード -1）は集計対象外
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    return [
+        (categories[i], int(count))
+        for i, count in enumerate(counts)
+        if count
+    ]
+
+
+def order_ranks(series: pd.Series, order: list[str]) -> np.ndarray:
+    """
+    カテゴリ列の各行に、指定した並び順での順位を割り当てる。
+
+    Args:
+        series: カテゴリ型の列
+        order: 並び順（含まれない値と欠損は999）
+
+    Returns:
+        np.ndarray: 各行の順位
+    """
+    rank_of = {name: i for i, name in enumerate(order)}
+    category_ranks = np.array(
+        [rank_of.get(name, 999) for name in series.cat.categories] + [999],
+        dtype=np.int16
+    )
+    # 欠損のコード -1 は末尾の999を指す
+    return category_ranks[series.cat.codes.to_numpy()]
+
+
 def sort_dataframe(
     df: pd.DataFrame,
     sort_by: str,
@@ -110,33 +322,23 @@ def sort_dataframe(
         pd.DataFrame: ソート済みデータフレーム
     """
     ascending = sort_order == "asc"
-    result_df = df.copy()
+    # sort_values / take は新しいフレームを返すため、事前の copy は不要
+    result_df = df
 
     if sort_by == "開始日":
         result_df = result_df.sort_values(
             ["開始日", "担当者"],
             ascending=[ascending, True]
         )
-    elif sort_by == "担当者":
-        # カスタム順序でソート
-        result_df["担当者_order"] = result_df["担当者"].apply(
-            lambda x: assignee_order.index(x) if x in assignee_order else 999
-        )
-        result_df = result_df.sort_values(
-            ["担当者_order", "開始日"],
-            ascending=[ascending, True]
-        )
-        result_df = result_df.drop(columns=["担当者_order"])
-    elif sort_by == "カテゴリ":
-        # カスタム順序でソート
-        result_df["カテゴリ_order"] = result_df["カテゴリ"].apply(
-            lambda x: category_order.index(x) if x in category_order else 999
-        )
-        result_df = result_df.sort_values(
-            ["カテゴリ_order", "開始日"],
-            ascending=[ascending, True]
-        )
-        result_df = result_df.drop(columns=["カテゴリ_order"])
+    elif sort_by in ("担当者", "カテゴリ"):
+        # カスタム順序でソート（順位はカテゴリ単位で引き、行へはコードで展開する）
+        order = assignee_order if sort_by == "担当者" else category_order
+        ranks = order_ranks(result_df[sort_by], order)
+        if not ascending:
+            ranks = -ranks
+        # lexsort は最後のキーが第1キー、安定ソートで同順位は元の並びを保つ
+        positions = np.lexsort((result_df["開始日"].to_numpy(), ranks))
+        result_df = result_df.take(positions)
 
     return result_df
 
@@ -145,6 +347,24 @@ def sort_dataframe(
 # ガントチャート生成
 # =============================================================================
 
+def to_day_strings(
+    values: Union[pd.Series, np.ndarray, Sequence[pd.Timestamp]]
+) -> np.ndarray:
+    """
+    日時の配列を日単位の文字列（YYYY-MM-DD）に変換する。
+
+    Plotlyは日時を時刻付きのISO文字列で送るため、
+    日付だけを送ってfigureのJSONを小さくする。
+
+    Args:
+        values: 日時の配列（Series, ndarray, タプル等）
+
+    Returns:
+        np.ndarray: YYYY-MM-DD形式の文字列配列
+    """
+    return np.datetime_as_string(np.asarray(values, dtype="datetime64[D]"), unit="D")
+
+
 def create_gantt_chart(
     df: pd.DataFrame,
     color_by: str = "カテゴリ",
@@ -177,61 +397,74 @@ def create_gantt_chart(
 
     color_map = CATEGORY_COLORS if color_by == "カテゴリ" else ASSIGNEE_COLORS
 
-    # グループ化に応じてY軸のラベルを調整
-    df_chart = df.copy()
-    if group_by == "担当者":
-        df_chart["y_label"] = df_chart["担当者"] + " | " + df_chart["タスク"]
-    elif group_by == "カテゴリ":
-        df_chart["y_label"] = df_chart["カテゴリ"] + " | " + df_chart["タスク"]
-    else:
-        df_chart["y_label"] = df_chart["タスク"]
-
-    # ガントチャート作成
-    fig = px.timeline(
-        df_chart,
-        x_start="開始日",
-        x_end="終了日",
-        y="y_label",
-        color=color_by,
-        color_discrete_map=color_map,
-        custom_data=["四半期", "週番号", "担当者", "カテゴリ", "成果物/マイルストーン", "期間"],
-    )
+    # グループ化に応じてY軸のラベルを選択（ラベルは読み込み時に計算済み）
+    y_labels = df[Y_LABEL_COLUMNS.get(group_by, "タスク")].to_numpy()
 
-    # ホバーテンプレート設定
-    fig.update_traces(
-        hovertemplate=(
-            "<b>%{y}</b><br>"
-            "期間: %{x|%Y/%m/%d} 〜 %{customdata[5]}日間<br>"
-            "四半期: %{customdata[0]} / %{customdata[1]}<br>"
-            "担当者: %{customdata[2]}<br>"
-            "カテゴリ: %{customdata[3]}<br>"
-            "成果物: %{customdata[4]}<br>"
-            "<extra></extra>"
-        )
+    # マイルストーンはバー終端のテキストとして★を表示する
+    milestone_marks = np.where(df["is_milestone"].to_numpy(), "★", "")
+
+    # バーは開始日を base、終了日までの長さ（ミリ秒）を x とする
+    # 日付は日単位で表示するため、時刻部分を落として送信量を減らす
+    starts = df["開始日"].to_numpy()
+    bar_bases = to_day_strings(starts)
+    bar_lengths = (
+        (df["終了日"].to_numpy() - starts).astype("timedelta64[ms]").astype(np.int64)
     )
 
-    # マイルストーン強調（★付きタスク）
-    milestones = df_chart[df_chart["is_milestone"]]
-    if not milestones.empty:
-        fig.add_trace(go.Scatter(
-            x=milestones["終了日"],
-            y=milestones["y_label"],
-            mode="markers",
-            marker=dict(
-                symbol="star",
-                size=14,
-                color="gold",
-                line=dict(color="black", width=1)
+    # ホバー用データ。色分けの列はトレース内で一定なので、テンプレートに直接埋め込む
+    other_col = "担当者" if color_by == "カテゴリ" else "カテゴリ"
+    custom_data = np.column_stack([
+        df["四半期"].to_numpy(dtype=object),
+        df["週番号"].to_numpy(dtype=object),
+        df[other_col].to_numpy(dtype=object),
+        df["成果物/マイルストーン"].to_numpy(dtype=object),
+        df["期間"].to_numpy(dtype=object),
+    ])
+
+    # 色分けの値ごとに1トレース。凡例・トレース順は絞り込みやソートに依らずカテゴリ順で固定
+    color_codes = df[color_by].cat.codes.to_numpy()
+    color_names = df[color_by].cat.categories
+    traces = []
+    for code in np.unique(color_codes):
+        name = color_names[code] if code >= 0 else ""
+        rows = np.flatnonzero(color_codes == code)
+        fields = {color_by: name, other_col: "%{customdata[2]}"}
+        traces.append(go.Bar(
+            name=name,
+            legendgroup=name,
+            orientation="h",
+            base=bar_bases[rows],
+            x=bar_lengths[rows],
+            y=y_labels[rows],
+            marker_color=color_map.get(name, "#999999"),
+            text=milestone_marks[rows],
+            customdata=custom_data[rows],
+            hovertemplate=(
+                "<b>%{y}</b><br>"
+                "期間: %{x|%Y/%m/%d} 〜 %{customdata[4]}日間<br>"
+                "四半期: %{customdata[0]} / %{customdata[1]}<br>"
+                f"担当者: {fields['担当者']}<br>"
+                f"カテゴリ: {fields['カテゴリ']}<br>"
+                "成果物: %{customdata[3]}<br>"
+                "<extra></extra>"
             ),
-            name="★マイルストーン",
-            hoverinfo="skip"
+            # マイルストーン強調（★付きタスク）: 別トレースを追加せずバーのテキストで描画
+            textposition="outside",
+            textfont=dict(color="#d4a017", size=14),
+            cliponaxis=False,
         ))
 
+    # レイアウトの固定部分は雛形から取り、描画ごとに変わる値だけ後で設定する
+    fig = go.Figure(
+        data=traces,
+        layout=GANTT_BASE_LAYOUTS.get(granularity, GANTT_BASE_LAYOUTS["month"])
+    )
+
     # 今日線を追加
     if show_today_line:
         today = datetime.now()
-        chart_min_date = df_chart["開始日"].min()
-        chart_max_date = df_chart["終了日"].max()
+        chart_min_date = df["開始日"].min()
+        chart_max_date = df["終了日"].max()
 
         if chart_min_date <= today <= chart_max_date:
             fig.add_vline(
@@ -239,47 +472,19 @@ def create_gantt_chart(
                 line_dash="dash",
                 line_color="red",
                 line_width=2,
+                name="today",
                 annotation_text="今日",
-                annotation_position="top"
+                annotation_position="top",
+                annotation_name="today"
             )
 
-    # レイアウト調整
-    chart_height = max(500, len(df_chart) * 28)
+    # 描画ごとに変わるのは凡例タイトル・高さ・Y軸の並び順のみ
     fig.update_layout(
-        height=chart_height,
-        xaxis_title="日付",
-        yaxis_title="",
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-            bgcolor="rgba(255,255,255,0.8)"
-        ),
-        margin=dict(l=300, r=50, t=80, b=50),
-        paper_bgcolor="white",
-        plot_bgcolor="#fafafa",
-        yaxis=dict(
-            categoryorder="array",
-            categoryarray=df_chart["y_label"].tolist()[::-1]
-        ),
-        font=dict(family="Noto Sans JP, sans-serif"),
+        legend_title_text=color_by,
+        height=max(500, len(df) * 28),
+        yaxis_categoryarray=y_labels[::-1],
     )
 
-    # X軸の粒度設定
-    if granularity == "day":
-        fig.update_xaxes(dtick="D1", tickformat="%m/%d", tickangle=45)
-    elif granularity == "week":
-        fig.update_xaxes(dtick="D7", tickformat="%m/%d")
-    else:  # month
-        fig.update_xaxes(dtick="M1", tickformat="%Y/%m")
-
-    # グリッド線
-    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor="rgba(0,0,0,0.1)")
-    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor="rgba(0,0,0,0.05)")
-
     return fig
 
 
@@ -287,12 +492,6 @@ def create_gantt_chart(
 # Excelガントチャート出力
 # =============================================================================
 
-def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """16進数カラーコードをRGBタプルに変換"""
-    hex_color = hex_color.lstrip("#")
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-
 def create_excel_gantt_chart(
     df: pd.DataFrame,
     granularity: str,
@@ -309,19 +508,20 @@ def create_excel_gantt_chart(
     Returns:
         BytesIO: Excelファイルのバイトストリーム
     """
+    output = BytesIO()
+
     if df.empty:
-        output = BytesIO()
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "ガントチャート"
-        ws["A1"] = "データがありません"
-        wb.save(output)
+        wb = xlsxwriter.Workbook(output, EXCEL_WORKBOOK_OPTIONS)
+        ws = wb.add_worksheet("ガントチャート")
+        ws.write(0, 0, "データがありません")
+        wb.close()
         output.seek(0)
         return output
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "ガントチャート"
+    # セルオブジェクトを保持しない xlsxwriter で直接書き出す
+    # constant_memory では行を上から順に1行ずつ書き切る必要がある
+    wb = xlsxwriter.Workbook(output, EXCEL_WORKBOOK_OPTIONS)
+    ws = wb.add_worksheet("ガントチャート")
 
     # 色マップの選択
     color_map = CATEGORY_COLORS if color_by == "カテゴリ" else ASSIGNEE_COLORS
@@ -334,37 +534,42 @@ def create_excel_gantt_chart(
     if granularity == "day":
         date_list = pd.date_range(start=start_date, end=end_date, freq="D")
         date_format = "%m/%d"
-        header_format = "%m/%d\n(%a)"
+        header_format = "mm/dd\n(ddd)"
     elif granularity == "week":
         # 週の開始日（月曜日）に揃える
         week_start = start_date - timedelta(days=start_date.weekday())
         date_list = pd.date_range(start=week_start, end=end_date, freq="W-MON")
         date_format = "%m/%d"
-        header_format = "%m/%d"
+        header_format = "mm/dd"
     else:  # month
         # 月初に揃える
         month_start = start_date.replace(day=1)
         date_list = pd.date_range(start=month_start, end=end_date, freq="MS")
         date_format = "%Y/%m"
-        header_format = "%Y/%m"
-
-    # スタイル定義
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=9)
-    task_font = Font(size=9)
-    center_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    left_align = Alignment(horizontal="left", vertical="center", wrap_text=True)
-    thin_border = Border(
-        left=Side(style="thin", color="CCCCCC"),
-        right=Side(style="thin", color="CCCCCC"),
-        top=Side(style="thin", color="CCCCCC"),
-        bottom=Side(style="thin", color="CCCCCC")
-    )
-
-    # ヘッダー行1: 年/月（月粒度の場合は四半期）
-    # ヘッダー行2: 日付
-    header_row = 2
-    task_start_row = 3
+        header_format = "yyyy/mm"
+
+    # スタイル定義（xlsxwriter はフォント・塗り・配置・罫線を1つの書式で持つ）
+    thin_border = {"border": 1, "border_color": "#CCCCCC"}
+    header_style = wb.add_format({
+        "bold": True, "font_color": "#FFFFFF", "font_size": 9,
+        "bg_color": "#4472C4", "align": "center", "valign": "vcenter",
+        "text_wrap": True, **thin_border
+    })
+    task_center_style = wb.add_format({
+        "font_size": 9, "align": "center", "valign": "vcenter",
+        "text_wrap": True, **thin_border
+    })
+    task_left_style = wb.add_format({
+        "font_size": 9, "align": "left", "valign": "vcenter",
+        "text_wrap": True, **thin_border
+    })
+    # 日付ヘッダーは strftime で文字列化せず、Excelの表示形式で整形する
+    header_date_style = wb.add_format({
+        "bold": True, "font_color": "#FFFFFF", "font_size": 9,
+        "bg_color": "#4472C4", "align": "center", "valign": "vcenter",
+        "text_wrap": True, "num_format": header_format, **thin_border
+    })
+    border_style = wb.add_format(thin_border)
 
     # 列の設定
     # A列: No.
@@ -374,149 +579,134 @@ def create_excel_gantt_chart(
     # E列以降: 日付
 
     # ヘッダー設定
-    ws.cell(row=1, column=1, value="No.").font = header_font
-    ws.cell(row=1, column=1).fill = header_fill
-    ws.cell(row=1, column=1).alignment = center_align
-    ws.cell(row=1, column=1).border = thin_border
-    ws.column_dimensions["A"].width = 5
-
-    ws.cell(row=1, column=2, value="担当者").font = header_font
-    ws.cell(row=1, column=2).fill = header_fill
-    ws.cell(row=1, column=2).alignment = center_align
-    ws.cell(row=1, column=2).border = thin_border
-    ws.column_dimensions["B"].width = 8
-
-    ws.cell(row=1, column=3, value="カテゴリ").font = header_font
-    ws.cell(row=1, column=3).fill = header_fill
-    ws.cell(row=1, column=3).alignment = center_align
-    ws.cell(row=1, column=3).border = thin_border
-    ws.column_dimensions["C"].width = 18
-
-    ws.cell(row=1, column=4, value="タスク").font = header_font
-    ws.cell(row=1, column=4).fill = header_fill
-    ws.cell(row=1, column=4).alignment = center_align
-    ws.cell(row=1, column=4).border = thin_border
-    ws.column_dimensions["D"].width = 45
+    ws.set_row(0, 20)
+    ws.write(0, 0, "No.", header_style)
+    ws.set_column(0, 0, 5)
+
+    ws.write(0, 1, "担当者", header_style)
+    ws.set_column(1, 1, 8)
+
+    ws.write(0, 2, "カテゴリ", header_style)
+    ws.set_column(2, 2, 18)
+
+    ws.write(0, 3, "タスク", header_style)
+    ws.set_column(3, 3, 45)
 
     # 日付ヘッダー
-    date_start_col = 5
+    date_start_col = 4
     for i, d in enumerate(date_list):
         col = date_start_col + i
-        cell = ws.cell(row=1, column=col, value=d.strftime(header_format))
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = center_align
-        cell.border = thin_border
-
-        # 列幅設定
-        if granularity == "day":
-            ws.column_dimensions[get_column_letter(col)].width = 5
-        elif granularity == "week":
-            ws.column_dimensions[get_column_letter(col)].width = 6
-        else:
-            ws.column_dimensions[get_column_letter(col)].width = 8
+        ws.write_datetime(0, col, d.to_pydatetime(), header_date_style)
+
+    # 列幅設定
+    if granularity == "day":
+        date_col_width = 5
+    elif granularity == "week":
+        date_col_width = 6
+    else:
+        date_col_width = 8
+    if len(date_list) > 0:
+        ws.set_column(date_start_col, date_start_col + len(date_list) - 1, date_col_width)
+
+    # 列を配列として一度だけ取り出す（iterrows による行ごとの Series 生成を避ける）
+    assignees = df["担当者"].to_numpy()
+    categories = df["カテゴリ"].to_numpy()
+    task_names = df["タスク"].to_numpy()
+    is_milestone = df["is_milestone"].to_numpy()
+    task_starts = df["開始日"].to_numpy()
+    task_ends = df["終了日"].to_numpy()
+    color_keys = df[color_by].to_numpy()
+
+    # 色ごとの塗りつぶし書式（行ごとに作らず、グリッドと凡例で共有する）
+    fill_styles = {
+        key: wb.add_format({"bg_color": hex_color, **thin_border})
+        for key, hex_color in color_map.items()
+    }
+    default_fill_style = wb.add_format({"bg_color": "#999999", **thin_border})
+
+    # 粒度に応じた各期間の開始日・終了日
+    period_starts = date_list.to_numpy()
+    if granularity == "day":
+        period_ends = period_starts
+    elif granularity == "week":
+        period_ends = (date_list + pd.Timedelta(days=6)).to_numpy()
+    else:  # month
+        period_ends = (date_list + pd.offsets.MonthEnd(0)).to_numpy()
+
+    # タスク期間と各期間が重なるかを (タスク数 × 期間数) の行列で一括判定
+    overlap = (
+        (task_starts[:, None] <= period_ends[None, :])
+        & (task_ends[:, None] >= period_starts[None, :])
+    )
+
+    # 重なるセルだけを (行, 列) の一覧にし、各タスク行の範囲を区切り位置で引く
+    # np.nonzero は行優先で返すため、行内の列は昇順（constant_memory の書き込み順）になる
+    hit_rows, hit_cols = np.nonzero(overlap)
+    hit_cols = hit_cols + date_start_col
+    row_bounds = np.searchsorted(hit_rows, np.arange(len(df) + 1))
 
     # タスク行の出力
-    for row_idx, (_, task) in enumerate(df.iterrows(), start=2):
+    for task_idx in range(len(df)):
+        row_idx = task_idx + 1
+        ws.set_row(row_idx, 20)
+
         # No.
-        ws.cell(row=row_idx, column=1, value=row_idx - 1).font = task_font
-        ws.cell(row=row_idx, column=1).alignment = center_align
-        ws.cell(row=row_idx, column=1).border = thin_border
+        ws.write(row_idx, 0, row_idx, task_center_style)
 
         # 担当者
-        ws.cell(row=row_idx, column=2, value=task["担当者"]).font = task_font
-        ws.cell(row=row_idx, column=2).alignment = center_align
-        ws.cell(row=row_idx, column=2).border = thin_border
+        ws.write(row_idx, 1, assignees[task_idx], task_center_style)
 
         # カテゴリ
-        ws.cell(row=row_idx, column=3, value=task["カテゴリ"]).font = task_font
-        ws.cell(row=row_idx, column=3).alignment = left_align
-        ws.cell(row=row_idx, column=3).border = thin_border
+        ws.write(row_idx, 2, categories[task_idx], task_left_style)
 
         # タスク名（マイルストーンは★を付ける）
-        task_name = task["タスク"]
-        if task["is_milestone"]:
+        task_name = task_names[task_idx]
+        if is_milestone[task_idx]:
             task_name = "★ " + task_name
-        ws.cell(row=row_idx, column=4, value=task_name).font = task_font
-        ws.cell(row=row_idx, column=4).alignment = left_align
-        ws.cell(row=row_idx, column=4).border = thin_border
+        ws.write(row_idx, 3, task_name, task_left_style)
 
         # 色の取得
-        color_key = task[color_by]
-        hex_color = color_map.get(color_key, "#999999")
-        rgb = hex_to_rgb(hex_color)
-        fill_color = PatternFill(
-            start_color=f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}",
-            end_color=f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}",
-            fill_type="solid"
-        )
+        fill_style = fill_styles.get(color_keys[task_idx], default_fill_style)
 
-        # 日付セルの塗りつぶし
-        task_start = task["開始日"]
-        task_end = task["終了日"]
-
-        for i, d in enumerate(date_list):
-            col = date_start_col + i
-            cell = ws.cell(row=row_idx, column=col)
-            cell.border = thin_border
-
-            # 粒度に応じた期間判定
-            if granularity == "day":
-                period_start = d
-                period_end = d
-            elif granularity == "week":
-                period_start = d
-                period_end = d + timedelta(days=6)
-            else:  # month
-                period_start = d
-                # 月末を計算
-                if d.month == 12:
-                    period_end = d.replace(year=d.year + 1, month=1, day=1) - timedelta(days=1)
-                else:
-                    period_end = d.replace(month=d.month + 1, day=1) - timedelta(days=1)
-
-            # タスク期間と重なるかチェック
-            if task_start <= period_end and task_end >= period_start:
-                cell.fill = fill_color
-
-    # 行の高さ設定
-    for row in range(1, len(df) + 2):
-        ws.row_dimensions[row].height = 20
+        # 日付セルの塗りつぶし（期間に重なるセルだけ書き込む）
+        for col in hit_cols[row_bounds[task_idx]:row_bounds[task_idx + 1]].tolist():
+            ws.write_blank(row_idx, col, None, fill_style)
+
+    # 空の日付セルの罫線はセルごとに書かず、条件付き書式1件でまとめて引く
+    if len(date_list) > 0 and len(df) > 0:
+        ws.conditional_format(
+            1, date_start_col, len(df), date_start_col + len(date_list) - 1,
+            {"type": "formula", "criteria": "=TRUE", "format": border_style}
+        )
 
     # ウィンドウ枠の固定（ヘッダーとタスク名列）
-    ws.freeze_panes = "E2"
+    ws.freeze_panes(1, 4)
 
     # 凡例シートの追加
-    ws_legend = wb.create_sheet(title="凡例")
+    ws_legend = wb.add_worksheet("凡例")
 
-    ws_legend.cell(row=1, column=1, value="【色の凡例】").font = Font(bold=True, size=11)
+    legend_title_style = wb.add_format({"bold": True, "font_size": 11})
+    legend_name_style = wb.add_format({"font_size": 10})
+    ws_legend.write(0, 0, "【色の凡例】", legend_title_style)
 
-    legend_items = CATEGORY_COLORS if color_by == "カテゴリ" else ASSIGNEE_COLORS
-    for i, (name, hex_color) in enumerate(legend_items.items(), start=3):
-        rgb = hex_to_rgb(hex_color)
-        fill = PatternFill(
-            start_color=f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}",
-            end_color=f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}",
-            fill_type="solid"
-        )
-        ws_legend.cell(row=i, column=1).fill = fill
-        ws_legend.cell(row=i, column=1).border = thin_border
-        ws_legend.cell(row=i, column=2, value=name).font = Font(size=10)
-        ws_legend.column_dimensions["A"].width = 5
-        ws_legend.column_dimensions["B"].width = 20
+    for i, name in enumerate(color_map, start=2):
+        ws_legend.write_blank(i, 0, None, fill_styles[name])
+        ws_legend.write(i, 1, name, legend_name_style)
+    ws_legend.set_column(0, 0, 5)
+    ws_legend.set_column(1, 1, 20)
 
     # サマリー情報
-    summary_row = len(legend_items) + 5
-    ws_legend.cell(row=summary_row, column=1, value="【サマリー】").font = Font(bold=True, size=11)
-    ws_legend.cell(row=summary_row + 1, column=1, value="総タスク数:")
-    ws_legend.cell(row=summary_row + 1, column=2, value=len(df))
-    ws_legend.cell(row=summary_row + 2, column=1, value="期間:")
-    ws_legend.cell(row=summary_row + 2, column=2, value=f"{start_date.strftime('%Y/%m/%d')} 〜 {end_date.strftime('%Y/%m/%d')}")
-    ws_legend.cell(row=summary_row + 3, column=1, value="マイルストーン数:")
-    ws_legend.cell(row=summary_row + 3, column=2, value=df["is_milestone"].sum())
-
-    output = BytesIO()
-    wb.save(output)
+    summary_row = len(color_map) + 4
+    ws_legend.write(summary_row, 0, "【サマリー】", legend_title_style)
+    summary_items = [
+        ("総タスク数:", len(df)),
+        ("期間:", f"{start_date.strftime('%Y/%m/%d')} 〜 {end_date.strftime('%Y/%m/%d')}"),
+        ("マイルストーン数:", int(df["is_milestone"].sum())),
+    ]
+    for i, item in enumerate(summary_items, start=summary_row + 1):
+        ws_legend.write_row(i, 0, item)
+
+    wb.close()
     output.seek(0)
     return output
 
@@ -536,14 +726,301 @@ app = Dash(
 )
 app.title = "EEZO 2026 タスクダッシュボード"
 
+# 同じフィルター条件の再描画ではチャート生成を省略する
+cache = Cache(app.server, config={
+    "CACHE_TYPE": "SimpleCache",
+    "CACHE_DEFAULT_TIMEOUT": CACHE_TIMEOUT,
+})
+
 # データ読み込み
 df = load_data(DATA_PATH)
+filter_codes = build_filter_codes(df)
 
 # 日付範囲の計算
 min_date = df["開始日"].min()
 max_date = df["終了日"].max()
 date_range_days = (max_date - min_date).days
 
+# スライダー値（日数）ごとの日付（列と同じ datetime64。コールバックでは添字で引くだけにする）
+slider_dates = min_date.to_datetime64() + np.arange(date_range_days + 1) * np.timedelta64(1, "D")
+
+# 日付範囲の絞り込みで比較する列の配列（コールバックごとに取り出さない）
+task_start_values = df["開始日"].to_numpy()
+task_end_values = df["終了日"].to_numpy()
+
+# 開始日順の並び（日付範囲の区間を二分探索で求めるため、起動時に1回だけソートする）
+start_date_order = np.argsort(task_start_values, kind="stable")
+sorted_start_values = task_start_values[start_date_order]
+
+# フィルターの選択肢（カテゴリ型の categories から一度だけ生成）
+# 表示名と値が同じなので、Dropdown には値のリストをそのまま options として渡す
+quarter_values = sorted(df["四半期"].cat.categories)
+assignee_values = df["担当者"].cat.categories.tolist()
+category_values = df["カテゴリ"].cat.categories.tolist()
+
+# 日付範囲スライダーの目盛り（範囲を4等分した5点の年月）
+date_mark_days = [date_range_days * i // 4 for i in range(5)]
+date_slider_marks = dict(zip(
+    date_mark_days,
+    (min_date + pd.to_timedelta(date_mark_days, unit="D")).strftime("%Y/%m")
+))
+
+# カテゴリ別バッジの表示名（長い名前は省略）。カテゴリは固定なので起動時に1回だけ作る
+category_badge_labels = {
+    c: c[:4] + "…" if len(c) > 5 else c for c in category_values
+}
+
+
+@cache.memoize()
+def filtered_row_indices(
+    quarters: tuple[str, ...],
+    assignees: tuple[str, ...],
+    categories: tuple[str, ...],
+    date_range: tuple[int, int]
+) -> np.ndarray:
+    """
+    フィルター条件に一致する行の位置を求める（条件ごとにメモ化）。
+
+    画面更新とExcel出力で同じ絞り込み結果を共有するため、
+    データフレームではなく小さな整数配列をキャッシュする。
+
+    Args:
+        quarters: 選択された四半期（ソート済み）
+        assignees: 選択された担当者（ソート済み）
+        categories: 選択されたカテゴリ（ソート済み）
+        date_range: 日付範囲スライダーの値（min_dateからの日数）
+
+    Returns:
+        np.ndarray: 該当行の位置（int32）
+    """
+    # 直接入力で小数が来ても結果が変わらない向きで整数にする（開始側は切り上げ、終了側は切り捨て）
+    offsets = np.array([np.ceil(date_range[0]), np.floor(date_range[1])], dtype=np.int64)
+
+    # 範囲全体がデータの期間外なら該当なし。一部だけはみ出す場合は期間の端に丸める
+    # （全タスクが期間内にあるため、端に丸めても絞り込み結果は変わらない）
+    if offsets[0] > date_range_days or offsets[1] < 0:
+        return np.empty(0, dtype=np.int32)
+    start_date, end_date = slider_dates[np.clip(offsets, 0, date_range_days)]
+
+    # 終了日 >= 開始日 なので、範囲内のタスクは開始日順で連続した区間に収まる
+    # 区間は二分探索で求め、終了日の判定は区間内の候補だけに行う
+    lo = np.searchsorted(sorted_start_values, start_date, side="left")
+    hi = np.searchsorted(sorted_start_values, end_date, side="right")
+    candidates = start_date_order[lo:hi]
+    candidates = candidates[task_end_values[candidates] <= end_date]
+
+    mask = combine_filter_masks(
+        filter_codes,
+        {"四半期": quarters, "担当者": assignees, "カテゴリ": categories},
+        len(df)
+    )
+    return np.sort(candidates[mask[candidates]]).astype(np.int32)
+
+
+def filter_tasks(
+    quarters: list[str],
+    assignees: list[str],
+    categories: list[str],
+    date_range: list[int]
+) -> pd.DataFrame:
+    """
+    フィルター条件に一致するタスクを抽出する。
+
+    Args:
+        quarters: 選択された四半期
+        assignees: 選択された担当者
+        categories: 選択されたカテゴリ
+        date_range: 日付範囲スライダーの値（min_dateからの日数）
+
+    Returns:
+        pd.DataFrame: 絞り込み後のデータフレーム
+    """
+    indices = filtered_row_indices(
+        tuple(sorted(quarters or [])),
+        tuple(sorted(assignees or [])),
+        tuple(sorted(categories or [])),
+        tuple(date_range)
+    )
+    # take は位置指定で新しいフレームを返すため、追加の copy は不要
+    return df.take(indices)
+
+
+@cache.memoize()
+def sorted_row_indices(
+    quarters: tuple[str, ...],
+    assignees: tuple[str, ...],
+    categories: tuple[str, ...],
+    date_range: tuple[int, int],
+    sort_by: str,
+    sort_order: str,
+    category_order: tuple[str, ...],
+    assignee_order: tuple[str, ...]
+) -> np.ndarray:
+    """
+    絞り込み・ソート後の行の位置を求める（条件ごとにメモ化）。
+
+    画面表示とExcel出力で同じ並び順を共有するため、位置の配列だけをキャッシュする。
+    df の index は読み込み時の RangeIndex のため、ソート後の index がそのまま位置になる。
+
+    Args:
+        quarters: 選択された四半期（ソート済み）
+        assignees: 選択された担当者（ソート済み）
+        categories: 選択されたカテゴリ（ソート済み）
+        date_range: 日付範囲スライダーの値
+        sort_by: ソートキー
+        sort_order: ソート順
+        category_order: カテゴリの並び順
+        assignee_order: 担当者の並び順
+
+    Returns:
+        np.ndarray: 表示順に並べた該当行の位置（int32）
+    """
+    sorted_df = sort_dataframe(
+        df.take(filtered_row_indices(quarters, assignees, categories, date_range)),
+        sort_by=sort_by,
+        sort_order=sort_order,
+        category_order=list(category_order),
+        assignee_order=list(assignee_order)
+    )
+    return sorted_df.index.to_numpy().astype(np.int32)
+
+
+def filter_and_sort_tasks(
+    quarters: list[str],
+    assignees: list[str],
+    categories: list[str],
+    date_range: list[int],
+    sort_by: str,
+    sort_order: str,
+    category_order: list[str],
+    assignee_order: list[str]
+) -> pd.DataFrame:
+    """
+    フィルター条件に一致するタスクを抽出し、表示順に並べる。
+
+    Args:
+        quarters: 選択された四半期
+        assignees: 選択された担当者
+        categories: 選択されたカテゴリ
+        date_range: 日付範囲スライダーの値（min_dateからの日数）
+        sort_by: ソートキー
+        sort_order: ソート順
+        category_order: カテゴリの並び順（未指定時は既定の順序）
+        assignee_order: 担当者の並び順（未指定時は既定の順序）
+
+    Returns:
+        pd.DataFrame: 絞り込み・ソート後のデータフレーム
+    """
+    indices = sorted_row_indices(
+        tuple(sorted(quarters or [])),
+        tuple(sorted(assignees or [])),
+        tuple(sorted(categories or [])),
+        tuple(date_range),
+        sort_by,
+        sort_order,
+        tuple(category_order or DEFAULT_CATEGORY_ORDER),
+        tuple(assignee_order or DEFAULT_ASSIGNEE_ORDER)
+    )
+    return df.take(indices)
+
+
+@cache.memoize()
+def build_gantt_figure(
+    quarters: tuple[str, ...],
+    assignees: tuple[str, ...],
+    categories: tuple[str, ...],
+    date_range: tuple[int, int],
+    sort_by: str,
+    sort_order: str,
+    category_order: tuple[str, ...],
+    assignee_order: tuple[str, ...],
+    color_by: str,
+    granularity: str,
+    group_by: str
+) -> str:
+    """
+    フィルター条件からガントチャートを生成する（条件ごとにメモ化）。
+
+    引数はキャッシュキーになるためタプルで受け取る。
+    選択順に意味のない四半期・担当者・カテゴリはソート済みで渡すこと。
+    キャッシュヒット時に日付や配列のシリアライズを繰り返さないよう、
+    JSON文字列として返す。
+    今日線は常に含め、表示・非表示はクライアント側 toggleToday で切り替える。
+
+    Args:
+        quarters: 選択された四半期
+        assignees: 選択された担当者
+        categories: 選択されたカテゴリ
+        date_range: 日付範囲スライダーの値
+        sort_by: ソートキー
+        sort_order: ソート順
+        category_order: カテゴリの並び順
+        assignee_order: 担当者の並び順
+        color_by: 色分けの基準
+        granularity: 時間粒度
+        group_by: グループ化
+
+    Returns:
+        str: PlotlyのfigureのJSON文字列
+    """
+    filtered_df = filter_and_sort_tasks(
+        list(quarters), list(assignees), list(categories), list(date_range),
+        sort_by, sort_order, list(category_order), list(assignee_order)
+    )
+    fig = create_gantt_chart(
+        filtered_df,
+        color_by=color_by,
+        granularity=granularity,
+        group_by=group_by,
+        show_today_line=True
+    )
+    return pio.to_json(fig, validate=False)
+
+
+@cache.memoize()
+def summarize_tasks(
+    quarters: tuple[str, ...],
+    assignees: tuple[str, ...],
+    categories: tuple[str, ...],
+    date_range: tuple[int, int]
+) -> dict:
+    """
+    フィルター条件に一致するタスクのサマリーを集計する（条件ごとにメモ化）。
+
+    サマリーは表示設定に依存しないため、絞り込み条件だけをキーにする。
+
+    Args:
+        quarters: 選択された四半期（ソート済み）
+        assignees: 選択された担当者（ソート済み）
+        categories: 選択されたカテゴリ（ソート済み）
+        date_range: 日付範囲スライダーの値
+
+    Returns:
+        dict: タスク数・期間・担当者別/カテゴリ別件数（JSONに変換可能な形）
+    """
+    filtered_df = filter_tasks(
+        list(quarters), list(assignees), list(categories), list(date_range)
+    )
+    stats = {"total": len(filtered_df)}
+
+    if not filtered_df.empty:
+        stats["start"] = filtered_df["開始日"].min().strftime("%Y/%m/%d")
+        stats["end"] = filtered_df["終了日"].max().strftime("%Y/%m/%d")
+
+        # 担当者別サマリー: [担当者, 件数, バッジ色]
+        stats["assignees"] = [
+            [k, v, "primary" if k == "松永" else "danger"]
+            for k, v in count_by_category(filtered_df["担当者"])
+        ]
+
+        # カテゴリ別サマリー: [バッジ表示名, 件数, 背景色]
+        stats["categories"] = [
+            [category_badge_labels.get(k, k), v, CATEGORY_COLORS.get(k, "#999")]
+            for k, v in count_by_category(filtered_df["カテゴリ"])
+        ]
+
+    return stats
+
 
 # =============================================================================
 # レイアウト
@@ -588,8 +1065,8 @@ filter_card = dbc.Card([
                 dbc.Label("四半期", className="fw-bold text-muted small"),
                 dcc.Dropdown(
                     id="quarter-filter",
-                    options=[{"label": q, "value": q} for q in sorted(df["四半期"].unique())],
-                    value=sorted(df["四半期"].unique().tolist()),
+                    options=quarter_values,
+                    value=quarter_values,
                     multi=True,
                     placeholder="四半期を選択..."
                 )
@@ -598,8 +1075,8 @@ filter_card = dbc.Card([
                 dbc.Label("担当者", className="fw-bold text-muted small"),
                 dcc.Dropdown(
                     id="assignee-filter",
-                    options=[{"label": a, "value": a} for a in df["担当者"].unique()],
-                    value=df["担当者"].unique().tolist(),
+                    options=assignee_values,
+                    value=assignee_values,
                     multi=True,
                     placeholder="担当者を選択..."
                 )
@@ -608,8 +1085,8 @@ filter_card = dbc.Card([
                 dbc.Label("カテゴリ", className="fw-bold text-muted small"),
                 dcc.Dropdown(
                     id="category-filter",
-                    options=[{"label": c, "value": c} for c in df["カテゴリ"].unique()],
-                    value=df["カテゴリ"].unique().tolist(),
+                    options=category_values,
+                    value=category_values,
                     multi=True,
                     placeholder="カテゴリを選択..."
                 )
@@ -704,7 +1181,8 @@ filter_card = dbc.Card([
                 dbc.Label("カテゴリ並び順", className="fw-bold text-muted small"),
                 dcc.Dropdown(
                     id="category-order",
-                    options=[{"label": c, "value": c} for c in DEFAULT_CATEGORY_ORDER],
+                    # 表示名と値が同じなので、既定の並び順をそのまま options に渡す
+                    options=DEFAULT_CATEGORY_ORDER,
                     value=DEFAULT_CATEGORY_ORDER,
                     multi=True,
                     placeholder="ドラッグで並べ替え..."
@@ -714,7 +1192,7 @@ filter_card = dbc.Card([
                 dbc.Label("担当者並び順", className="fw-bold text-muted small"),
                 dcc.Dropdown(
                     id="assignee-order",
-                    options=[{"label": a, "value": a} for a in DEFAULT_ASSIGNEE_ORDER],
+                    options=DEFAULT_ASSIGNEE_ORDER,
                     value=DEFAULT_ASSIGNEE_ORDER,
                     multi=True,
                     placeholder="ドラッグで並べ替え..."
@@ -732,13 +1210,7 @@ filter_card = dbc.Card([
                     max=date_range_days,
                     step=7,
                     value=[0, date_range_days],
-                    marks={
-                        0: min_date.strftime("%Y/%m"),
-                        date_range_days // 4: (min_date + pd.Timedelta(days=date_range_days // 4)).strftime("%Y/%m"),
-                        date_range_days // 2: (min_date + pd.Timedelta(days=date_range_days // 2)).strftime("%Y/%m"),
-                        date_range_days * 3 // 4: (min_date + pd.Timedelta(days=date_range_days * 3 // 4)).strftime("%Y/%m"),
-                        date_range_days: max_date.strftime("%Y/%m"),
-                    },
+                    marks=date_slider_marks,
                     tooltip={"placement": "bottom", "always_visible": False}
                 )
             ], md=12),
@@ -784,27 +1256,32 @@ summary_card = dbc.Card([
 
 # メインレイアウト
 app.layout = dbc.Container([
+    dcc.Store(id="stats-store"),
     header,
     filter_card,
     summary_card,
     dbc.Card([
         dbc.CardBody([
             dcc.Loading(
-                dcc.Graph(
-                    id="gantt-chart",
-                    config={
-                        "displayModeBar": True,
-                        "displaylogo": False,
-                        "modeBarButtonsToRemove": ["lasso2d", "select2d"],
-                        "toImageButtonOptions": {
-                            "format": "png",
-                            "filename": "eezo_gantt_chart",
-                            "height": 1200,
-                            "width": 1800,
-                            "scale": 2
+                # サーバー側の図の生成中もスピナーを出すため、図を受け取る Store も Loading 内に置く
+                [
+                    dcc.Store(id="figure-store"),
+                    dcc.Graph(
+                        id="gantt-chart",
+                        config={
+                            "displayModeBar": True,
+                            "displaylogo": False,
+                            "modeBarButtonsToRemove": ["lasso2d", "select2d"],
+                            "toImageButtonOptions": {
+                                "format": "png",
+                                "filename": "eezo_gantt_chart",
+                                "height": 1200,
+                                "width": 1800,
+                                "scale": 2
+                            }
                         }
-                    }
-                ),
+                    )
+                ],
                 type="circle",
                 color="#3498db"
             )
@@ -818,11 +1295,29 @@ app.layout = dbc.Container([
 # =============================================================================
 
 @callback(
-    [Output("gantt-chart", "figure"),
-     Output("total-tasks", "children"),
-     Output("date-range", "children"),
-     Output("assignee-summary", "children"),
-     Output("category-summary", "children")],
+    Output("stats-store", "data"),
+    [Input("quarter-filter", "value"),
+     Input("assignee-filter", "value"),
+     Input("category-filter", "value"),
+     Input("date-range-slider", "value")]
+)
+def update_summary(
+    quarters: list[str],
+    assignees: list[str],
+    categories: list[str],
+    date_range: list[int]
+) -> dict:
+    """絞り込み条件の変更時にサマリー集計を更新（表示の組み立てはクライアント側 renderSummary で行う）"""
+    return summarize_tasks(
+        tuple(sorted(quarters or [])),
+        tuple(sorted(assignees or [])),
+        tuple(sorted(categories or [])),
+        tuple(date_range)
+    )
+
+
+@callback(
+    Output("figure-store", "data"),
     [Input("quarter-filter", "value"),
      Input("assignee-filter", "value"),
      Input("category-filter", "value"),
@@ -833,8 +1328,7 @@ app.layout = dbc.Container([
      Input("sort-order", "value"),
      Input("category-order", "value"),
      Input("assignee-order", "value"),
-     Input("date-range-slider", "value"),
-     Input("show-today-line", "value")]
+     Input("date-range-slider", "value")]
 )
 def update_dashboard(
     quarters: list[str],
@@ -847,82 +1341,62 @@ def update_dashboard(
     sort_order: str,
     category_order: list[str],
     assignee_order: list[str],
-    date_range: list[int],
-    show_today_line: list
-) -> tuple:
-    """フィルター変更時にダッシュボードを更新"""
-
-    # 日付範囲の計算
-    start_date = min_date + pd.Timedelta(days=date_range[0])
-    end_date = min_date + pd.Timedelta(days=date_range[1])
-
-    # フィルタリング
-    filtered_df = df[
-        (df["四半期"].isin(quarters or [])) &
-        (df["担当者"].isin(assignees or [])) &
-        (df["カテゴリ"].isin(categories or [])) &
-        (df["開始日"] >= start_date) &
-        (df["終了日"] <= end_date)
-    ].copy()
-
-    # ソート
-    filtered_df = sort_dataframe(
-        filtered_df,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        category_order=category_order or DEFAULT_CATEGORY_ORDER,
-        assignee_order=assignee_order or DEFAULT_ASSIGNEE_ORDER
+    date_range: list[int]
+) -> Union[dict, Patch]:
+    """フィルター・表示設定の変更時にガントチャートを更新"""
+
+    # ガントチャート生成（同一条件はキャッシュから返す）
+    fig_json = build_gantt_figure(
+        tuple(sorted(quarters or [])),
+        tuple(sorted(assignees or [])),
+        tuple(sorted(categories or [])),
+        tuple(date_range),
+        sort_by,
+        sort_order,
+        tuple(category_order or DEFAULT_CATEGORY_ORDER),
+        tuple(assignee_order or DEFAULT_ASSIGNEE_ORDER),
+        color_by,
+        granularity,
+        group_by
     )
+    fig = orjson.loads(fig_json)
+    layout = fig["layout"]
 
-    # ガントチャート生成
-    show_today = True in (show_today_line or [])
-    fig = create_gantt_chart(
-        filtered_df,
-        color_by=color_by,
-        granularity=granularity,
-        group_by=group_by,
-        show_today_line=show_today
-    )
-
-    # サマリー計算
-    total = len(filtered_df)
+    # 初回描画と「データなし」の図は全体を送る
+    if ctx.triggered_id is None or "title" in layout:
+        return fig
 
-    if not filtered_df.empty:
-        date_range_str = f"{filtered_df['開始日'].min().strftime('%Y/%m/%d')} 〜 {filtered_df['終了日'].max().strftime('%Y/%m/%d')}"
-
-        # 担当者別サマリー
-        assignee_counts = filtered_df.groupby("担当者").size()
-        assignee_badges = [
-            dbc.Badge(
-                f"{k}: {v}",
-                color="primary" if k == "松永" else "danger",
-                className="me-1"
-            )
-            for k, v in assignee_counts.items()
-        ]
+    # 2回目以降はテンプレート（図ごとに不変）を送り直さず、それ以外を差し替える
+    # 今日線が範囲外になった場合に前の図の線が残らないよう、線の有無に関わらず上書きする
+    layout.setdefault("shapes", [])
+    layout.setdefault("annotations", [])
+    patch = Patch()
+    patch["data"] = fig["data"]
+    for key, value in layout.items():
+        if key != "template":
+            patch["layout"][key] = value
+    # 直前が「データなし」の図だった場合のタイトルを消す
+    del patch["layout"]["title"]
+    return patch
+
+
+# サマリー表示はサーバーに戻らずブラウザで描画する（src/assets/clientside.js）
+app.clientside_callback(
+    ClientsideFunction(namespace="gantt", function_name="renderSummary"),
+    [Output("total-tasks", "children"),
+     Output("date-range", "children"),
+     Output("assignee-summary", "children"),
+     Output("category-summary", "children")],
+    Input("stats-store", "data")
+)
 
-        # カテゴリ別サマリー
-        category_counts = filtered_df.groupby("カテゴリ").size()
-        category_badges = [
-            dbc.Badge(
-                f"{k[:4]}…: {v}" if len(k) > 5 else f"{k}: {v}",
-                style={"backgroundColor": CATEGORY_COLORS.get(k, "#999")},
-                className="me-1 mb-1"
-            )
-            for k, v in category_counts.items()
-        ]
-    else:
-        date_range_str = "-"
-        assignee_badges = "-"
-        category_badges = "-"
-
-    return (
-        fig,
-        f"{total}",
-        date_range_str,
-        assignee_badges,
-        category_badges
-    )
+# 今日線の表示切り替えは図を作り直さずブラウザで反映する
+app.clientside_callback(
+    ClientsideFunction(namespace="gantt", function_name="toggleToday"),
+    Output("gantt-chart", "figure"),
+    [Input("figure-store", "data"),
+     Input("show-today-line", "value")]
+)
 
 
 @callback(
@@ -955,25 +1429,10 @@ def download_excel(
 ) -> dict:
     """フィルター適用後のデータをExcelガントチャートでダウンロード"""
 
-    # 日付範囲の計算
-    start_date = min_date + pd.Timedelta(days=date_range[0])
-    end_date = min_date + pd.Timedelta(days=date_range[1])
-
-    filtered_df = df[
-        (df["四半期"].isin(quarters or [])) &
-        (df["担当者"].isin(assignees or [])) &
-        (df["カテゴリ"].isin(categories or [])) &
-        (df["開始日"] >= start_date) &
-        (df["終了日"] <= end_date)
-    ].copy()
-
-    # ソート（画面と同じ順序）
-    filtered_df = sort_dataframe(
-        filtered_df,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        category_order=category_order or DEFAULT_CATEGORY_ORDER,
-        assignee_order=assignee_order or DEFAULT_ASSIGNEE_ORDER
+    # 絞り込み・ソート（画面表示と同じ条件ならキャッシュ済みの並び順を使う）
+    filtered_df = filter_and_sort_tasks(
+        quarters, assignees, categories, date_range,
+        sort_by, sort_order, category_order, assignee_order
     )
 
     # Excelガントチャート生成
@@ -1000,11 +1459,17 @@ if __name__ == "__main__":
     print("  EEZO 2026 タスクダッシュボード")
     print("=" * 60)
     print(f"  データ: {len(df)} タスク")
-    print(f"  期間: {df['開始日'].min().strftime('%Y/%m/%d')} 〜 {df['終了日'].max().strftime('%Y/%m/%d')}")
-    print(f"  担当者: {', '.join(df['担当者'].unique())}")
-    print(f"  カテゴリ: {len(df['カテゴリ'].unique())} 種類")
+    print(f"  期間: {min_date.strftime('%Y/%m/%d')} 〜 {max_date.strftime('%Y/%m/%d')}")
+    print(f"  担当者: {', '.join(assignee_values)}")
+    print(f"  カテゴリ: {len(category_values)} 種類")
     print("=" * 60)
     print("  アクセス: http://127.0.0.1:8050")
     print("=" * 60)
 
-    app.run(debug=True, host="0.0.0.0", port=8050)
+    # DASH_DEBUG=1 のときだけ開発サーバー（ホットリロード・デバッグ表示）で起動する
+    if os.environ.get("DASH_DEBUG") == "1":
+        app.run(debug=True, host="0.0.0.0", port=8050)
+    else:
+        # waitress は本番起動時にだけ必要なため、ここで読み込む
+        from waitress import serve
+        serve(app.server, host="0.0.0.0", port=8050, threads=8)
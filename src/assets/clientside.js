@@ -0,0 +1,83 @@
+/**
+ * EEZO 2026 タスクダッシュボード - クライアントサイドコールバック
+ *
+ * サーバーを経由しない軽量な表示更新を定義する。
+ */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    gantt: {
+        /**
+         * stats-store の集計結果からサマリーカードを描画する。
+         *
+         * @param {Object} stats - update_summary が返す集計結果
+         * @returns {Array} [タスク数, 期間, 担当者別バッジ, カテゴリ別バッジ]
+         */
+        renderSummary: function (stats) {
+            if (!stats) {
+                return window.dash_clientside.no_update;
+            }
+            if (!stats.total) {
+                return [String(stats.total || 0), "-", "-", "-"];
+            }
+
+            const badge = function (label, props) {
+                return {
+                    type: "Badge",
+                    namespace: "dash_bootstrap_components",
+                    props: Object.assign({children: label}, props)
+                };
+            };
+
+            const assigneeBadges = stats.assignees.map(function (item) {
+                return badge(item[0] + ": " + item[1], {
+                    color: item[2],
+                    className: "me-1"
+                });
+            });
+
+            // カテゴリ名の省略はサーバー側（category_badge_labels）で済ませてある
+            const categoryBadges = stats.categories.map(function (item) {
+                return badge(item[0] + ": " + item[1], {
+                    style: {backgroundColor: item[2]},
+                    className: "me-1 mb-1"
+                });
+            });
+
+            return [
+                String(stats.total),
+                stats.start + " 〜 " + stats.end,
+                assigneeBadges,
+                categoryBadges
+            ];
+        },
+
+        /**
+         * figure-store の図に今日線の表示・非表示を反映する。
+         *
+         * @param {Object} figure - update_dashboard が返す図（今日線を含む）
+         * @param {Array} showTodayLine - 今日線チェックボックスの値
+         * @returns {Object} gantt-chart に渡す図
+         */
+        toggleToday: function (figure, showTodayLine) {
+            if (!figure) {
+                return window.dash_clientside.no_update;
+            }
+            const visible = (showTodayLine || []).indexOf(true) !== -1;
+            const setVisible = function (items) {
+                return (items || []).map(function (item) {
+                    return item.name === "today"
+                        ? Object.assign({}, item, {visible: visible})
+                        : item;
+                });
+            };
+
+            // 元の store データは書き換えず、レイアウトだけ差し替えた図を返す
+            return Object.assign({}, figure, {
+                layout: Object.assign({}, figure.layout, {
+                    shapes: setVisible(figure.layout.shapes),
+                    annotations: setVisible(figure.layout.annotations)
+                })
+            });
+        }
+    }
+});